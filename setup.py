@@ -13,6 +13,17 @@ def read_readme():
             return f.read()
     return "tqdm++ - Enhanced Progress Bar with Intelligent Emoji Feedback"
 
+# Optionally compile the per-tick modules with mypyc (set TQDMPP_USE_MYPYC=1);
+# the default install stays pure Python
+def compiled_modules():
+    if os.environ.get('TQDMPP_USE_MYPYC') != '1':
+        return []
+    from mypyc.build import mypycify
+    return mypycify([
+        'tqdmpp/metrics.py',
+        'tqdmpp/emoji_selectors.py',
+    ])
+
 setup(
     name="tqdmpp",
     version="2.0.0",
@@ -23,6 +34,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/VaibhavChemboli116/Smart_TQDM",
     packages=find_packages(),
+    ext_modules=compiled_modules(),
+    package_data={"tqdmpp": ["py.typed"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
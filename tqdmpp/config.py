@@ -9,6 +9,13 @@ class ProgressBarConfig:
     MIN_BAR_WIDTH = 10  # Minimum width for progress bar
     MIN_TERM_WIDTH = 40  # Minimum terminal width
     DEFAULT_HISTORY_SIZE = 5  # Default metric history size for trend analysis
+    TREND_WINDOW_SIZE = 3  # Number of recent values compared for trend detection
+    DEFAULT_MININTERVAL = 0.1  # Minimum seconds between redraws
+    DEFAULT_MAXINTERVAL = 10.0  # Maximum seconds between redraws (overrides miniters)
+    NON_INTERACTIVE_LINES = 50  # Approximate log lines per run when stdout is not a terminal
+    GRADIENT_CACHE_SIZE = 512  # Maximum number of cached gradient bar widths
+    BAR_CACHE_SIZE = 1024  # Maximum number of cached bar bodies (everything up to the closing ┃)
+    TERMINAL_WIDTH_REFRESH = 0.5  # Seconds before the cached terminal width is re-queried
     
     # Trend detection thresholds
     ACCURACY_THRESHOLD = 0.005  # Sensitivity for accuracy trend detection
@@ -16,6 +23,9 @@ class ProgressBarConfig:
     
     # Best metric tolerance (for floating point comparisons)
     BEST_METRIC_TOLERANCE = 0.001
+    
+    # Format spec applied to float metrics when the bar is rendered
+    METRIC_FORMAT = '.4g'
 
 
 # Emoji mapping for different states
@@ -1,10 +1,11 @@
 """
 Terminal display and rendering functionality for SmartBar
 """
+import os
 import sys
 import shutil
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from .config import ProgressBarConfig, ColorConfig
 
@@ -12,57 +13,138 @@ from .config import ProgressBarConfig, ColorConfig
 class TerminalRenderer:
     """Handles terminal rendering and display formatting"""
     
-    def __init__(self):
-        self.last_print_len = 0
+    def __init__(self) -> None:
+        self.last_bar_str = ""
         self.warned_narrow = False
+        self._gradient_cache: Dict[int, str] = {}  # filled_width -> rendered gradient
+        self._bar_cache: Dict[tuple, str] = {}  # (filled_width, available_width, desc, emoji) -> bar body
+        self._term_width = 80
+        self._term_width_at = float('-inf')  # monotonic time of the last size query
+        self._metrics_cache: Tuple[Optional[tuple], str] = (None, "")  # (metrics items snapshot, formatted string)
+        self._layout_static: Tuple[Optional[str], Optional[int], str, int] = (None, None, "", 0)  # (desc, emoji_len, desc_display, fixed width)
+        self._build_gradient_palette()
     
-    def get_terminal_width(self) -> int:
-        """Get current terminal width"""
+    def _build_gradient_palette(self) -> None:
+        """Precompute the ANSI segment for every color the gradient can produce"""
+        # Segments carry no reset: the next SGR overrides the color and the
+        # whole bar is reset once at the end
+        char = ProgressBarConfig.SLIM_CHAR
+        # Red -> yellow half, indexed by green channel value
+        self._warm_palette = [
+            f"\033[38;2;{ColorConfig.RED[0]};{g};{ColorConfig.RED[2]}m{char}"
+            for g in range(ColorConfig.YELLOW[1] + 1)
+        ]
+        # Yellow -> green half, indexed by red channel value
+        self._cool_palette = [
+            f"\033[38;2;{r};{ColorConfig.GREEN[1]};{ColorConfig.GREEN[2]}m{char}"
+            for r in range(ColorConfig.YELLOW[0] + 1)
+        ]
+    
+    def is_interactive(self) -> bool:
+        """Whether stdout can show the animated bar (a terminal or a Jupyter kernel)"""
+        if 'ipykernel' in sys.modules:
+            return True
         try:
-            return shutil.get_terminal_size().columns
+            return sys.stdout.isatty() and os.environ.get('TERM') != 'dumb'
         except Exception:
-            return 80
+            return False
+    
+    def get_terminal_width(self) -> int:
+        """Get current terminal width, re-queried at most every TERMINAL_WIDTH_REFRESH seconds"""
+        now = time.monotonic()
+        if now - self._term_width_at >= ProgressBarConfig.TERMINAL_WIDTH_REFRESH:
+            try:
+                self._term_width = shutil.get_terminal_size().columns
+            except Exception:
+                self._term_width = 80
+            self._term_width_at = now
+        return self._term_width
     
     def create_color_gradient_bar(self, filled_width: int) -> str:
         """Create a color gradient filled bar segment"""
         if filled_width <= 0:
             return ""
         
-        colored_filled = ""
+        # The gradient depends only on the width, so reuse earlier renders
+        cached = self._gradient_cache.get(filled_width)
+        if cached is not None:
+            return cached
+        
+        # Hoist loop invariants into locals
+        char = ProgressBarConfig.SLIM_CHAR
+        warm_palette = self._warm_palette
+        cool_palette = self._cool_palette
+        warm_scale = ColorConfig.YELLOW[1]
+        cool_scale = ColorConfig.YELLOW[0]
+        denom = max(1, filled_width - 1)
+        
+        segments = [""] * filled_width
+        prev = None
         for i in range(filled_width):
             # Calculate gradient position (0=start, 1=end)
-            pos = i / max(1, filled_width - 1)
+            pos = i / denom
             # Interpolate colors: red (0) -> yellow (0.5) -> green (1)
             if pos <= 0.5:
                 # Red to yellow
-                ratio = pos * 2
-                r = ColorConfig.RED[0]
-                g = int(ColorConfig.YELLOW[1] * ratio)
-                b = ColorConfig.RED[2]
+                seg = warm_palette[int(warm_scale * (pos * 2))]
             else:
                 # Yellow to green
-                ratio = (pos - 0.5) * 2
-                r = int(ColorConfig.YELLOW[0] * (1 - ratio))
-                g = ColorConfig.GREEN[1]
-                b = ColorConfig.GREEN[2]
-            colored_filled += f"\033[38;2;{r};{g};{b}m{ProgressBarConfig.SLIM_CHAR}\033[0m"
+                seg = cool_palette[int(cool_scale * (1 - (pos - 0.5) * 2))]
+            # Same color as the previous column: the terminal keeps it, emit the bare char
+            segments[i] = char if seg is prev else seg
+            prev = seg
+        colored_filled = "".join(segments) + "\033[0m"
         
+        if len(self._gradient_cache) >= ProgressBarConfig.GRADIENT_CACHE_SIZE:
+            self._gradient_cache.clear()
+        self._gradient_cache[filled_width] = colored_filled
         return colored_filled
     
+    def format_metrics(self, metrics: Dict[str, Any]) -> str:
+        """Format metrics for display, applying METRIC_FORMAT to float values
+        
+        The string is reused while the metrics items compare equal to the last
+        formatted ones, so in-place edits to the dict are still picked up.
+        """
+        snapshot = tuple(metrics.items())
+        cached_snapshot, cached_str = self._metrics_cache
+        if snapshot == cached_snapshot:
+            return cached_str
+        
+        parts = []
+        for k, v in metrics.items():
+            if isinstance(v, float):
+                v = format(v, ProgressBarConfig.METRIC_FORMAT)
+            parts.append(f"{k}:{v}")
+        metrics_str = " [" + " ".join(parts) + "]"
+        self._metrics_cache = (snapshot, metrics_str)
+        return metrics_str
+    
     def calculate_layout(self, desc: str, emoji: str, metrics: Dict[str, Any], 
                         n: int, total: int, start_time: float, 
                         show_emoji: bool, show_metrics: bool) -> Dict[str, Any]:
         """Calculate layout dimensions and components"""
         term_width = self.get_terminal_width()
         
-        # Calculate space needed for other elements
-        desc_len = len(desc) if desc else 0
+        # Description and emoji widths rarely change within a run, so reuse them
         emoji_len = len(emoji) if show_emoji and emoji else 0
+        cached_desc, cached_emoji_len, desc_display, static_needed = self._layout_static
+        if desc != cached_desc or emoji_len != cached_emoji_len:
+            desc_len = len(desc) if desc else 0
+            static_needed = (desc_len + emoji_len + 2 +  # desc + emoji + spaces
+                             2 + 2 +  # bar brackets
+                             10)  # padding
+            
+            # Truncate description if needed
+            desc_display = desc
+            if desc_len > 20:
+                desc_display = desc[:17] + "..."
+            self._layout_static = (desc, emoji_len, desc_display, static_needed)
         
         # Format metrics string
         metrics_str = ""
         if show_metrics and metrics:
-            metrics_str = " [" + " ".join([f"{k}:{v}" for k, v in metrics.items()]) + "]"
+            metrics_str = self.format_metrics(metrics)
         metrics_len = len(metrics_str)
         
         # Calculate progress info
@@ -71,9 +153,7 @@ class TerminalRenderer:
         time_str = f" [ {elapsed:.1f}s]"
         
         # Calculate total space needed
-        total_needed = (desc_len + emoji_len + 2 +  # desc + emoji + spaces
-                       2 + 2 +  # bar brackets
-                       len(progress_str) + len(time_str) + metrics_len + 10)  # progress + time + metrics + padding
+        total_needed = static_needed + len(progress_str) + len(time_str) + metrics_len
         
         # Calculate available bar width
         available_width = term_width - total_needed
@@ -83,11 +163,6 @@ class TerminalRenderer:
                 self.warned_narrow = True
             available_width = ProgressBarConfig.MIN_BAR_WIDTH
         
-        # Truncate description if needed
-        desc_display = desc
-        if desc_len > 20:
-            desc_display = desc[:17] + "..."
-        
         return {
             'term_width': term_width,
             'available_width': available_width,
@@ -105,47 +180,64 @@ class TerminalRenderer:
                                      show_emoji, show_metrics)
         
         # Build the bar
-        filled_width = int((n / total) * layout['available_width'])
-        empty_width = layout['available_width'] - filled_width
-        
-        filled_part = self.create_color_gradient_bar(filled_width)
-        empty_part = " " * empty_width
+        available_width = layout['available_width']
+        filled_width = int((n / total) * available_width)
+        if not show_emoji:
+            emoji = ""
         
-        # Build the complete bar string with emoji as slider head
-        bar_str = f"{layout['desc_display']}"
-        if show_emoji and emoji:
-            bar_str += f" ┃{filled_part}"
+        # The body up to the closing ┃ repeats across ticks, so render it once per key
+        key = (filled_width, available_width, layout['desc_display'], emoji)
+        bar_str = self._bar_cache.get(key)
+        if bar_str is None:
+            empty_width = available_width - filled_width
+            
+            filled_part = self.create_color_gradient_bar(filled_width)
+            empty_part = " " * empty_width
             
-            # Position the emoji at the current progress point
-            if filled_width < layout['available_width']:
-                bar_str += f"{emoji}{empty_part}"
+            # Build the complete bar string with emoji as slider head
+            bar_str = f"{layout['desc_display']}"
+            if emoji:
+                bar_str += f" ┃{filled_part}"
+                
+                # Position the emoji at the current progress point
+                if filled_width < available_width:
+                    bar_str += f"{emoji}{empty_part}"
+                else:
+                    # If bar is full, emoji goes at the end
+                    bar_str += f"{emoji}"
             else:
-                # If bar is full, emoji goes at the end
-                bar_str += f"{emoji}"
-        else:
-            bar_str += f" ┃{filled_part}{empty_part}"
+                bar_str += f" ┃{filled_part}{empty_part}"
             
-        bar_str += f"┃{layout['progress_str']}{layout['time_str']}{layout['metrics_str']}"
+            if len(self._bar_cache) >= ProgressBarConfig.BAR_CACHE_SIZE:
+                self._bar_cache.clear()
+            self._bar_cache[key] = bar_str
         
-        return bar_str
+        return f"{bar_str}┃{layout['progress_str']}{layout['time_str']}{layout['metrics_str']}"
+    
+    def render_plain_line(self, n: int, total: int, desc: str, metrics: Dict[str, Any],
+                          start_time: float, show_metrics: bool = True) -> str:
+        """Render a compact log line without colors, emoji or cursor control"""
+        elapsed = time.time() - start_time
+        line = f"{desc} {n}/{total} {((n / total) * 100):.1f}% [ {elapsed:.1f}s]"
+        if show_metrics and metrics:
+            line += self.format_metrics(metrics)
+        return line.lstrip()
+    
+    def print_line(self, line: str) -> None:
+        """Print a plain progress line for non-interactive output"""
+        sys.stdout.write(line + '\n')
+        sys.stdout.flush()
     
     def print_bar(self, bar_str: str) -> None:
         """Print the progress bar with terminal handling"""
-        try:
-            # Use carriage return to go to beginning of line
-            sys.stdout.write('\r')
-            # Clear the line
-            sys.stdout.write('\033[K')
-            # Write the new bar
-            sys.stdout.write(bar_str)
-            sys.stdout.flush()
-            self.last_print_len = len(bar_str)
-        except Exception:
-            # Fallback for terminals that don't support ANSI escape codes
-            sys.stdout.write('\r' + ' ' * self.last_print_len + '\r')
-            sys.stdout.write(bar_str)
-            sys.stdout.flush()
-            self.last_print_len = len(bar_str)
+        # Nothing visible changed since the last frame
+        if bar_str == self.last_bar_str:
+            return
+        
+        # Carriage return, clear the line and the new bar in a single write
+        sys.stdout.write('\r\033[K' + bar_str)
+        sys.stdout.flush()
+        self.last_bar_str = bar_str
     
     def finish(self) -> None:
         """Print final newline when progress is complete"""
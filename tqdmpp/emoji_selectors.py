@@ -7,6 +7,29 @@ from collections import deque
 from .config import ProgressBarConfig, EmojiConfig, DefaultConfig
 
 
+# Trend-based emoji tables, rows indexed by trend + 1 (declining, stable, improving)
+# and columns by severity (0/1). Cells name EmojiConfig attributes, which are read
+# at call time so runtime config overrides still apply
+_ACCURACY_TABLE = (
+    ('DECLINING_SEVERE', 'DECLINING'),  # Declining (column 1 = at least ACCURACY_AVERAGE)
+    ('STABLE', 'STABLE'),               # Stable
+    ('IMPROVING', 'IMPROVING'),         # Improving
+)
+
+_LOSS_TABLE = (
+    ('DECLINING', 'DECLINING_SEVERE'),  # Declining, loss increasing (column 1 = above LOSS_HIGH)
+    ('STABLE', 'STABLE'),               # Stable
+    ('IMPROVING', 'IMPROVING'),         # Improving, loss decreasing
+)
+
+# Default trend table indexed by [accuracy_trend + 1][loss_trend + 1]:
+# any improving trend wins, then any declining trend (cells name EmojiConfig attributes)
+_DEFAULT_TABLE = (
+    ('DECLINING', 'DECLINING', 'IMPROVING'),  # Accuracy declining
+    ('DECLINING', 'STABLE', 'IMPROVING'),     # Accuracy stable
+    ('IMPROVING', 'IMPROVING', 'IMPROVING'),  # Accuracy improving
+)
+
 class EmojiSelector:
     """Base class for emoji selection logic"""
     
@@ -29,12 +52,7 @@ class EmojiSelector:
                 return EmojiConfig.NEW_BEST  # New best!
         
         # Pure trend-based selection
-        if accuracy_trend == 1 or loss_trend == 1:
-            return EmojiConfig.IMPROVING  # Improving trend
-        elif accuracy_trend == -1 or loss_trend == -1:
-            return EmojiConfig.DECLINING  # Declining trend
-        else:
-            return EmojiConfig.STABLE  # Stable trend
+        return getattr(EmojiConfig, _DEFAULT_TABLE[accuracy_trend + 1][loss_trend + 1])
 
 
 def accuracy_based_selector(n: int, total: int, metrics: Dict[str, Any], start_time: float, 
@@ -51,16 +69,9 @@ def accuracy_based_selector(n: int, total: int, metrics: Dict[str, Any], start_t
     if accuracy >= best_accuracy - ProgressBarConfig.BEST_METRIC_TOLERANCE:
         return EmojiConfig.NEW_BEST  # New best accuracy!
     
-    # Pure trend-based selection
-    if accuracy_trend == 1:
-        return EmojiConfig.IMPROVING  # Improving
-    elif accuracy_trend == -1:
-        if accuracy < DefaultConfig.ACCURACY_AVERAGE:
-            return EmojiConfig.DECLINING_SEVERE  # Low accuracy and declining
-        else:
-            return EmojiConfig.DECLINING  # Declining
-    else:
-        return EmojiConfig.STABLE  # Stable
+    # Pure trend-based selection (low accuracy makes a decline severe)
+    severity = accuracy >= DefaultConfig.ACCURACY_AVERAGE
+    return getattr(EmojiConfig, _ACCURACY_TABLE[accuracy_trend + 1][severity])
 
 
 def loss_based_selector(n: int, total: int, metrics: Dict[str, Any], start_time: float, 
@@ -77,13 +88,6 @@ def loss_based_selector(n: int, total: int, metrics: Dict[str, Any], start_time:
     if loss <= best_loss + ProgressBarConfig.BEST_METRIC_TOLERANCE:
         return EmojiConfig.NEW_BEST  # New best loss!
     
-    # Pure trend-based selection
-    if loss_trend == 1:
-        return EmojiConfig.IMPROVING  # Improving (loss decreasing)
-    elif loss_trend == -1:
-        if loss > DefaultConfig.LOSS_HIGH:
-            return EmojiConfig.DECLINING_SEVERE  # High loss and increasing
-        else:
-            return EmojiConfig.DECLINING  # Declining (loss increasing)
-    else:
-        return EmojiConfig.STABLE  # Stable
\ No newline at end of file
+    # Pure trend-based selection (high loss makes a decline severe)
+    severity = loss > DefaultConfig.LOSS_HIGH
+    return getattr(EmojiConfig, _LOSS_TABLE[loss_trend + 1][severity])
\ No newline at end of file
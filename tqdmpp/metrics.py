@@ -8,8 +8,36 @@ from typing import Dict, Any
 from .config import ProgressBarConfig
 
 
+class TrendWindow:
+    """Fixed-size window of the most recent values of a single metric"""
+    __slots__ = ('values',)
+    
+    def __init__(self, size: int) -> None:
+        self.values: deque[float] = deque(maxlen=size)
+    
+    def push(self, value: float) -> None:
+        """Add a value, dropping the oldest once the window is full"""
+        self.values.append(value)
+    
+    def clear(self) -> None:
+        """Forget all values (the metric is missing from the latest update)"""
+        self.values.clear()
+    
+    def is_full(self) -> bool:
+        """Whether enough values have been seen to judge a trend"""
+        return len(self.values) == self.values.maxlen
+    
+    def direction(self, threshold: float) -> int:
+        """Compare newest to oldest value: 1 if it rose by more than threshold, -1 if it fell"""
+        oldest, newest = self.values[0], self.values[-1]
+        # Bools subtract to -1/0/1 without branching
+        return (newest > oldest + threshold) - (newest < oldest - threshold)
+
+
 class MetricTracker:
     """Handles metric history tracking and trend analysis"""
+    __slots__ = ('history_size', 'metric_history', 'best_accuracy', 'best_loss',
+                 'accuracy_trend', 'loss_trend', 'acc_window', 'loss_window')
     
     def __init__(self, history_size: int = ProgressBarConfig.DEFAULT_HISTORY_SIZE):
         self.history_size = history_size
@@ -18,6 +46,8 @@ class MetricTracker:
         self.best_loss = float('inf')
         self.accuracy_trend = 0  # -1: decreasing, 0: stable, 1: increasing
         self.loss_trend = 0      # -1: decreasing, 0: stable, 1: increasing
+        self.acc_window = TrendWindow(ProgressBarConfig.TREND_WINDOW_SIZE)
+        self.loss_window = TrendWindow(ProgressBarConfig.TREND_WINDOW_SIZE)
     
     def update_metrics(self, n: int, start_time: float, **kwargs) -> None:
         """Update metrics and store in history"""
@@ -28,51 +58,35 @@ class MetricTracker:
         }
         self.metric_history.append(current_metrics)
         
-        # Update best values
+        # Update best values and trend windows (a missing metric breaks its window)
         if 'acc' in kwargs:
             acc = float(kwargs['acc'])
             if acc > self.best_accuracy:
                 self.best_accuracy = acc
+            self.acc_window.push(acc)
+        else:
+            self.acc_window.clear()
         
         if 'loss' in kwargs:
             loss = float(kwargs['loss'])
             if loss < self.best_loss:
                 self.best_loss = loss
+            self.loss_window.push(loss)
+        else:
+            self.loss_window.clear()
         
-        # Calculate trends if we have enough history
+        # Recompute trends from the windows in constant time
         self._update_trends()
     
     def _update_trends(self) -> None:
-        """Update accuracy and loss trends based on recent history"""
-        if len(self.metric_history) < 3:
-            return
-        
-        # Get last 3 entries for trend calculation
-        recent = list(self.metric_history)[-3:]
-        
-        # Calculate accuracy trend with configured thresholds
-        if all('acc' in entry for entry in recent):
-            acc_values = [float(entry['acc']) for entry in recent]
-            # Use configured threshold for accuracy changes
-            threshold = ProgressBarConfig.ACCURACY_THRESHOLD
-            if acc_values[-1] > acc_values[0] + threshold:  # Significant improvement
-                self.accuracy_trend = 1
-            elif acc_values[-1] < acc_values[0] - threshold:  # Significant decrease
-                self.accuracy_trend = -1
-            else:
-                self.accuracy_trend = 0  # Stable
+        """Update accuracy and loss trends from the recent-value windows"""
+        # Accuracy improves when it rises past the configured threshold
+        if self.acc_window.is_full():
+            self.accuracy_trend = self.acc_window.direction(ProgressBarConfig.ACCURACY_THRESHOLD)
         
-        # Calculate loss trend with configured thresholds
-        if all('loss' in entry for entry in recent):
-            loss_values = [float(entry['loss']) for entry in recent]
-            # Use configured threshold for loss changes
-            threshold = ProgressBarConfig.LOSS_THRESHOLD
-            if loss_values[-1] < loss_values[0] - threshold:  # Significant improvement
-                self.loss_trend = 1
-            elif loss_values[-1] > loss_values[0] + threshold:  # Significant increase
-                self.loss_trend = -1
-            else:
-                self.loss_trend = 0  # Stable
+        # Loss improves when it falls past the configured threshold
+        if self.loss_window.is_full():
+            self.loss_trend = -self.loss_window.direction(ProgressBarConfig.LOSS_THRESHOLD)
     
     def get_trend_data(self) -> Dict[str, Any]:
         """Get current trend analysis data"""
@@ -26,7 +26,10 @@ class SmartBar:
     
     def __init__(self, total: int, desc: str = "", width: Optional[int] = None, 
                  show_emoji: bool = True, show_metrics: bool = True, 
-                 emoji_selector: Optional[Callable] = None):
+                 emoji_selector: Optional[Callable] = None, miniters: int = 1,
+                 mininterval: float = ProgressBarConfig.DEFAULT_MININTERVAL,
+                 maxinterval: float = ProgressBarConfig.DEFAULT_MAXINTERVAL,
+                 force_emoji: bool = False):
         """
         Initialize SmartBar with modular components
         
@@ -37,6 +40,10 @@ class SmartBar:
             show_emoji: Whether to show emoji indicators
             show_metrics: Whether to show metrics display
             emoji_selector: Custom emoji selection function
+            miniters: Minimum iterations between redraws (final iteration always redraws)
+            mininterval: Minimum seconds between redraws
+            maxinterval: Maximum seconds between redraws, even if miniters is not reached
+            force_emoji: Draw the full emoji bar even when stdout is not a terminal
         """
         # Basic configuration
         self.total = total
@@ -45,17 +52,30 @@ class SmartBar:
         self.show_emoji = show_emoji
         self.show_metrics = show_metrics
         self.emoji_selector = emoji_selector
+        self.miniters = max(1, miniters)
+        self.mininterval = mininterval
+        self.maxinterval = maxinterval
         
         # Progress tracking
         self.start_time = time.time()
         self.n = 0
         self.emoji = ""
         self.metrics: Dict[str, Any] = {}
+        self.last_print_n = 0
+        self.last_print_t = float('-inf')  # monotonic time of the last redraw
+        self.closed = False
+        self._metrics_stale = False  # Metrics set since the last redraw
+        self._drawn_metrics: tuple = ()  # Metrics items shown by the last redraw
+        self._emoji_key: Optional[tuple] = None  # Inputs the default emoji was selected for
         
         # Initialize modular components
         self.metric_tracker = MetricTracker(ProgressBarConfig.DEFAULT_HISTORY_SIZE)
         self.renderer = TerminalRenderer()
-        self.emoji_selector_instance = EmojiSelector()
+        
+        # Redirected output (logs, CI) gets plain periodic lines instead of a repainted bar
+        self.interactive = force_emoji or self.renderer.is_interactive()
+        if not self.interactive:
+            self.miniters = max(self.miniters, total // ProgressBarConfig.NON_INTERACTIVE_LINES)
 
     def set_emoji_selector(self, selector_func: Callable) -> None:
         """Set custom emoji selector function"""
@@ -64,39 +84,98 @@ class SmartBar:
     def set_metrics(self, **kwargs) -> None:
         """Set metrics and update history for trend analysis"""
         self.metrics.update(kwargs)
+        self._metrics_stale = True
         
         # Update metric tracker with current progress
         self.metric_tracker.update_metrics(self.n, self.start_time, **kwargs)
 
-    def _select_emoji(self, trend_data: Dict[str, Any]) -> str:
-        """Select emoji using the configured selector"""
-        return self.emoji_selector(
-            self.n, self.total, self.metrics, self.start_time,
-            trend_data['metric_history'], trend_data['best_accuracy'],
-            trend_data['best_loss'], trend_data['accuracy_trend'],
-            trend_data['loss_trend']
-        )
+    def update(self, n: int = 1, **kwargs) -> None:
+        """Advance progress by n and record metrics in a single call"""
+        if kwargs:
+            self.set_metrics(**kwargs)
+        self.n += n
+        self._maybe_print_bar()
 
-    def _print_bar(self) -> None:
-        """Internal method to print the progress bar"""
-        # Use intelligent default emoji selection based on trends and progress
-        trend_data = self.metric_tracker.get_trend_data()
-        self.emoji = self.emoji_selector_instance.intelligent_default_selector(
-            self.n, self.total, self.metrics,
-            trend_data['best_accuracy'], trend_data['best_loss'],
-            trend_data['accuracy_trend'], trend_data['loss_trend']
+    def _select_emoji(self, selector: Callable) -> str:
+        """Select emoji using the given custom selector"""
+        tracker = self.metric_tracker
+        return selector(
+            self.n, self.total, self.metrics, self.start_time,
+            tracker.metric_history, tracker.best_accuracy,
+            tracker.best_loss, tracker.accuracy_trend,
+            tracker.loss_trend
         )
 
-        # Update emoji based on custom selector if configured
+    def _render_bar(self) -> str:
+        """Select the emoji and render the full progress bar string"""
+        # Trend state is read straight off the tracker; get_trend_data() would build a dict per frame
         if self.show_emoji and self.emoji_selector:
-            self.emoji = self._select_emoji(trend_data)
+            # Custom selector replaces the default, so the default is never evaluated
+            self.emoji = self._select_emoji(self.emoji_selector)
+            self._emoji_key = None
+        else:
+            # The default depends only on metrics and trends, so reselect only when they change
+            tracker = self.metric_tracker
+            key = (tuple(self.metrics.items()), tracker.best_accuracy, tracker.best_loss,
+                   tracker.accuracy_trend, tracker.loss_trend)
+            if key != self._emoji_key:
+                self.emoji = EmojiSelector.intelligent_default_selector(
+                    self.n, self.total, self.metrics,
+                    tracker.best_accuracy, tracker.best_loss,
+                    tracker.accuracy_trend, tracker.loss_trend
+                )
+                self._emoji_key = key
         
-        # Render and print the progress bar
-        bar_str = self.renderer.render_progress_bar(
+        # Render the progress bar
+        return self.renderer.render_progress_bar(
             self.n, self.total, self.desc, self.emoji, self.metrics, 
             self.start_time, self.show_emoji, self.show_metrics
         )
-        self.renderer.print_bar(bar_str)
+
+    def _print_bar(self, now: Optional[float] = None) -> None:
+        """Internal method to print the progress bar (now: clock already read by the caller)"""
+        if self.interactive:
+            self.renderer.print_bar(self._render_bar())
+        else:
+            # Skip emoji selection, colors and carriage returns entirely
+            self.renderer.print_line(self.renderer.render_plain_line(
+                self.n, self.total, self.desc, self.metrics,
+                self.start_time, self.show_metrics
+            ))
+        self.last_print_n = self.n
+        self.last_print_t = time.monotonic() if now is None else now
+        self._metrics_stale = False
+        self._drawn_metrics = tuple(self.metrics.items())
+
+    def _maybe_print_bar(self) -> None:
+        """Redraw only when the miniters/mininterval gates allow it"""
+        # Skip redraws until enough iterations and time have accumulated
+        now = time.monotonic()
+        since_print = now - self.last_print_t
+        due = self.n - self.last_print_n >= self.miniters and since_print >= self.mininterval
+        if self.interactive:
+            due = due or self.n >= self.total or since_print >= self.maxinterval
+        elif self.n >= self.total:
+            # Plain lines are append-only: close() writes the final one exactly once
+            due = False
+        if due:
+            self._print_bar(now)
+
+    def refresh(self) -> None:
+        """Force an immediate redraw, bypassing the miniters/mininterval gates"""
+        self._print_bar()
+
+    def close(self) -> None:
+        """Draw the final state and end the progress line"""
+        if self.closed:
+            return
+        # Only redraw if something changed since the last frame, including direct edits to self.metrics
+        if (self._metrics_stale or self.n != self.last_print_n or
+                tuple(self.metrics.items()) != self._drawn_metrics):
+            self._print_bar()
+        if self.interactive:
+            self.renderer.finish()
+        self.closed = True
     
     def __iter__(self):
         """Make SmartBar iterable"""
@@ -105,8 +184,8 @@ class SmartBar:
     def __next__(self):
         """Iterator protocol for automatic progress updates"""
         if self.n >= self.total:
-            self.renderer.finish()  # New line when done
+            self.close()  # Final redraw and new line when done
             raise StopIteration
         self.n += 1
-        self._print_bar()
+        self._maybe_print_bar()
         return self.n - 1  # Return previous iteration number 
\ No newline at end of file